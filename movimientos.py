@@ -1,66 +1,116 @@
 import csv
+import os
+import re
 import sys
-from decimal import Decimal
+from concurrent.futures import ProcessPoolExecutor
 
-def leer_archivo_csv(nombre_archivo):
+# Tamaño del búfer usado al leer el archivo CSV (1 MiB)
+TAMANO_BUFFER_LECTURA = 1024 * 1024
+
+# A partir de este tamaño (64 MiB) el archivo se divide en tramos que se
+# procesan en paralelo, uno por cada núcleo disponible
+TAMANO_MINIMO_PARALELO = 64 * 1024 * 1024
+
+# Columnas que debe tener el archivo CSV
+COLUMNAS_REQUERIDAS = ('id', 'tipo', 'monto')
+
+def leer_archivo_csv(archivo):
     """
-    Lee un archivo CSV y devuelve sus filas como una lista de diccionarios.
+    Prepara la lectura de un archivo CSV ya abierto y valida sus encabezados.
+    
+    Las filas no se cargan en memoria: se devuelve el lector para recorrerlas
+    una a una mientras se calculan las estadísticas.
     
     Args:
-        nombre_archivo (str): Ruta al archivo CSV a leer
+        archivo (file): Archivo CSV abierto en modo texto
         
     Returns:
-        list: Lista de diccionarios, cada uno representa una fila del CSV
-        None: Si ocurre algún error al leer el archivo
+        tuple: (lector, columnas), donde lector entrega cada fila como una
+            lista de valores y columnas es un diccionario que asocia el
+            nombre de cada columna con su posición
+        None: Si el archivo no tiene las columnas necesarias
     """
-    try:
-        # Abrimos el archivo CSV para lectura
-        with open(nombre_archivo, 'r', encoding='utf-8') as archivo:
-            # Creamos un lector CSV que interpretará la primera fila como encabezados
-            lector_csv = csv.DictReader(archivo)
-            
-            # Verificamos que el archivo tenga las columnas necesarias
-            columnas_requeridas = {'id', 'tipo', 'monto'}
-            columnas_archivo = set(lector_csv.fieldnames)
-            
-            if not columnas_requeridas.issubset(columnas_archivo):
-                print(f"Error: El archivo CSV debe contener las columnas: {', '.join(columnas_requeridas)}")
-                return None
-            
-            # Convertimos el lector a una lista para poder usarlo múltiples veces
-            return list(lector_csv)
-            
-    except FileNotFoundError:
-        print(f"Error: No se pudo encontrar el archivo '{nombre_archivo}'")
+    # Creamos un lector CSV y leemos la primera fila como encabezados.
+    # Las filas se leen como listas, sin construir un diccionario por fila
+    lector_csv = csv.reader(archivo)
+    encabezados = next(lector_csv, [])
+    columnas = {nombre: posicion for posicion, nombre in enumerate(encabezados)}
+    
+    # Verificamos que el archivo tenga las columnas necesarias
+    if not all(columna in columnas for columna in COLUMNAS_REQUERIDAS):
+        print(f"Error: El archivo CSV debe contener las columnas: {', '.join(COLUMNAS_REQUERIDAS)}")
         return None
-    except Exception as e:
-        print(f"Error inesperado al leer el archivo: {e}")
+    
+    return lector_csv, columnas
+
+
+# Formato válido de un monto: signo opcional, parte entera y hasta dos decimales
+_MONTO_RE = re.compile(r'\s*(-?)([0-9]+)(?:\.([0-9]{1,2}))?\s*')
+
+
+def convertir_a_centavos(monto_str):
+    """
+    Convierte un monto en texto (por ejemplo "235.81") a un entero en centavos.
+    
+    Args:
+        monto_str (str): El monto como cadena de texto, con hasta dos decimales
+        
+    Returns:
+        int: El monto expresado en centavos
+        None: Si el texto no representa un monto válido
+    """
+    # Validamos el formato con la expresión regular en lugar de capturar
+    # excepciones, así no hay bloque try por cada fila
+    coincidencia = _MONTO_RE.fullmatch(monto_str)
+    if coincidencia is None:
         return None
+    
+    signo, entero, decimales = coincidencia.groups()
+    centavos = int(entero) * 100 + int((decimales or '').ljust(2, '0'))
+    return -centavos if signo else centavos
+
+
+def formatear_centavos(centavos):
+    """
+    Convierte un monto en centavos a texto con dos decimales (por ejemplo "235.81").
+    
+    Args:
+        centavos (int): El monto expresado en centavos
+        
+    Returns:
+        str: El monto formateado
+    """
+    signo = '-' if centavos < 0 else ''
+    centavos = abs(centavos)
+    return f"{signo}{centavos // 100}.{centavos % 100:02d}"
 
 
 def validar_monto(monto_str, id_transaccion):
     """
-    Convierte una cadena de texto a un valor Decimal y valida que sea un número válido.
+    Convierte una cadena de texto a centavos y valida que sea un número válido.
     
     Args:
         monto_str (str): El monto como cadena de texto
         id_transaccion (str): ID de la transacción para reportar errores
         
     Returns:
-        Decimal: El monto convertido a Decimal
+        int: El monto convertido a centavos
         None: Si el monto no es válido
     """
-    try:
-        # Intentamos convertir el monto a Decimal
-        return Decimal(monto_str)
-    except ValueError:
+    # Intentamos convertir el monto a centavos
+    monto = convertir_a_centavos(monto_str)
+    if monto is None:
         print(f"Error: Monto inválido en la transacción {id_transaccion}: {monto_str}")
-        return None
+    return monto
 
 
-def clasificar_transaccion(tipo):
+# Tabla de traducción que reemplaza las vocales acentuadas por su versión sin acento
+_SIN_ACENTOS = str.maketrans('ÁÉÍÓÚáéíóú', 'AEIOUaeiou')
+
+
+def _normalizar_tipo(tipo):
     """
-    Determina si el tipo de transacción es crédito, débito u otro.
+    Clasifica un tipo de transacción ignorando mayúsculas, acentos y espacios sobrantes.
     
     Args:
         tipo (str): El tipo de transacción del CSV
@@ -68,43 +118,96 @@ def clasificar_transaccion(tipo):
     Returns:
         str: 'credito', 'debito' o 'desconocido'
     """
-    # Convertimos a minúsculas y eliminamos acentos para comparar
-    tipo_lower = tipo.lower()
+    # Eliminamos acentos y espacios sobrantes y convertimos a minúsculas
+    tipo_normalizado = tipo.translate(_SIN_ACENTOS).strip().lower()
     
-    if tipo_lower == 'crédito' or tipo_lower == 'credito':
+    if tipo_normalizado == 'credito':
         return 'credito'
-    elif tipo_lower == 'débito' or tipo_lower == 'debito':
+    elif tipo_normalizado == 'debito':
         return 'debito'
     else:
         return 'desconocido'
 
 
-def calcular_estadisticas(transacciones):
+# Tabla precalculada con las escrituras habituales de cada tipo de transacción.
+# Las escrituras que no estén aquí se normalizan y, solo si resultan ser un
+# crédito o un débito, se agregan a la tabla. Los tipos desconocidos no se
+# guardan, para que la tabla no crezca con los valores inválidos del archivo.
+_TIPOS = {}
+for _tipo in ('crédito', 'credito', 'débito', 'debito'):
+    for _variante in (_tipo, _tipo.capitalize(), _tipo.upper()):
+        _TIPOS[_variante] = _normalizar_tipo(_variante)
+del _tipo, _variante
+
+
+def clasificar_transaccion(tipo):
+    """
+    Determina si el tipo de transacción es crédito, débito u otro.
+    
+    Args:
+        tipo (str): El tipo de transacción del CSV
+        
+    Returns:
+        str: 'credito', 'debito' o 'desconocido'
+    """
+    # Una sola búsqueda en la tabla resuelve los casos habituales
+    clase = _TIPOS.get(tipo)
+    if clase is None:
+        clase = _normalizar_tipo(tipo)
+        if clase != 'desconocido':
+            _TIPOS[tipo] = clase
+    return clase
+
+
+def calcular_estadisticas(transacciones, columnas):
     """
     Calcula todas las estadísticas necesarias para el reporte.
     
     Args:
-        transacciones (list): Lista de diccionarios con las transacciones
+        transacciones (iterable): Filas con las transacciones, que se recorren una sola vez
+        columnas (dict): Posición de cada columna dentro de las filas
         
     Returns:
         dict: Diccionario con todas las estadísticas calculadas
     """
     # Inicializamos las variables para almacenar los resultados
-    suma_creditos = Decimal('0')
-    suma_debitos = Decimal('0')
-    transaccion_mayor = {'id': None, 'monto': Decimal('0')}
+    # Los montos se acumulan como enteros en centavos
+    suma_creditos = 0
+    suma_debitos = 0
+    # Partimos de menos infinito para que la primera transacción siempre sea
+    # la mayor hasta ese momento, incluso si todos los montos son negativos
+    id_mayor = None
+    monto_mayor = float('-inf')
     contador_creditos = 0
     contador_debitos = 0
     
+    # Enlazamos las funciones y la tabla de tipos a variables locales: dentro
+    # del ciclo, una variable local se resuelve más rápido que una global
+    convertir = convertir_a_centavos
+    clasificar = clasificar_transaccion
+    tipos = _TIPOS
+    
+    # Posiciones de las columnas que usamos dentro de cada fila
+    col_id = columnas['id']
+    col_tipo = columnas['tipo']
+    col_monto = columnas['monto']
+    
     # Procesamos cada transacción
     for transaccion in transacciones:
-        # Validamos y convertimos el monto
-        monto = validar_monto(transaccion['monto'], transaccion['id'])
+        # Saltamos las líneas en blanco, como lo hacía csv.DictReader
+        if not transaccion:
+            continue
+        
+        # Validamos y convertimos el monto. Es lo mismo que hace validar_monto,
+        # escrito aquí para ahorrar una llamada a función por fila
+        monto = convertir(transaccion[col_monto])
         if monto is None:
+            print(f"Error: Monto inválido en la transacción {transaccion[col_id]}: {transaccion[col_monto]}")
             continue  # Saltamos esta transacción si el monto no es válido
         
-        # Clasificamos la transacción
-        tipo = clasificar_transaccion(transaccion['tipo'])
+        # Clasificamos la transacción. Los tipos habituales se resuelven
+        # directamente en la tabla; el resto pasa por clasificar_transaccion
+        tipo = tipos.get(transaccion[col_tipo]) or clasificar(transaccion[col_tipo])
         
         # Actualizamos estadísticas según el tipo
         if tipo == 'credito':
@@ -114,53 +217,79 @@ def calcular_estadisticas(transacciones):
             suma_debitos += monto
             contador_debitos += 1
         else:
-            print(f"Advertencia: Tipo de transacción desconocido: {transaccion['tipo']} en ID: {transaccion['id']}")
+            print(f"Advertencia: Tipo de transacción desconocido: {transaccion[col_tipo]} en ID: {transaccion[col_id]}")
         
         # Verificamos si esta transacción tiene el mayor monto hasta ahora
-        if monto > transaccion_mayor['monto']:
-            transaccion_mayor['id'] = transaccion['id']
-            transaccion_mayor['monto'] = monto
+        if monto > monto_mayor:
+            id_mayor = transaccion[col_id]
+            monto_mayor = monto
     
     # Calculamos el balance final
     balance_final = suma_creditos - suma_debitos
     
+    # Si no hubo transacciones válidas, informamos un monto mayor de cero
+    if id_mayor is None:
+        monto_mayor = 0
+    
     # Retornamos todas las estadísticas en un diccionario
     return {
         'suma_creditos': suma_creditos,
         'suma_debitos': suma_debitos,
         'balance_final': balance_final,
-        'transaccion_mayor': transaccion_mayor,
+        'transaccion_mayor': {'id': id_mayor, 'monto': monto_mayor},
         'contador_creditos': contador_creditos,
         'contador_debitos': contador_debitos
     }
 
 
-def generar_reporte(estadisticas):
+def formatear_reporte(estadisticas):
     """
-    Genera y muestra un reporte formateado con las estadísticas calculadas.
+    Arma el texto completo del reporte a partir de las estadísticas calculadas.
     
     Args:
         estadisticas (dict): Diccionario con todas las estadísticas calculadas
+        
+    Returns:
+        str: El reporte listo para mostrarse o guardarse
     """
-    print("\n===== REPORTE DE TRANSACCIONES BANCARIAS =====")
-    
-    # Mostramos el resumen de montos
-    print("\nResumen de Montos:")
-    print(f"  - Total Créditos: ${estadisticas['suma_creditos']}")
-    print(f"  - Total Débitos: ${estadisticas['suma_debitos']}")
-    print(f"Balance Final: ${estadisticas['balance_final']}")
-    
-    # Mostramos la transacción de mayor monto
     mayor = estadisticas['transaccion_mayor']
-    print(f"\nTransacción de Mayor Monto: ID {mayor['id']} con ${mayor['monto']}")
-    
-    # Mostramos el conteo de transacciones
     creditos = estadisticas['contador_creditos']
     debitos = estadisticas['contador_debitos']
-    print("\nConteo de Transacciones:")
-    print(f"  - Créditos: {creditos}")
-    print(f"  - Débitos: {debitos}")
-    print(f"  - Total: {creditos + debitos}")
+    
+    lineas = [
+        # Encabezado
+        "===== REPORTE DE TRANSACCIONES BANCARIAS =====",
+        
+        # Resumen de montos
+        "",
+        "Resumen de Montos:",
+        f"  - Total Créditos: ${formatear_centavos(estadisticas['suma_creditos'])}",
+        f"  - Total Débitos: ${formatear_centavos(estadisticas['suma_debitos'])}",
+        f"Balance Final: ${formatear_centavos(estadisticas['balance_final'])}",
+        
+        # Transacción de mayor monto
+        "",
+        f"Transacción de Mayor Monto: ID {mayor['id']} con ${formatear_centavos(mayor['monto'])}",
+        
+        # Conteo de transacciones
+        "",
+        "Conteo de Transacciones:",
+        f"  - Créditos: {creditos}",
+        f"  - Débitos: {debitos}",
+        f"  - Total: {creditos + debitos}",
+    ]
+    return "\n".join(lineas) + "\n"
+
+
+def generar_reporte(estadisticas):
+    """
+    Genera y muestra un reporte formateado con las estadísticas calculadas.
+    
+    Args:
+        estadisticas (dict): Diccionario con todas las estadísticas calculadas
+    """
+    # Mostramos todo el reporte con una sola escritura en pantalla
+    sys.stdout.write("\n" + formatear_reporte(estadisticas))
 
 
 def guardar_reporte(estadisticas, nombre_archivo_salida):
@@ -173,32 +302,211 @@ def guardar_reporte(estadisticas, nombre_archivo_salida):
     """
     try:
         with open(nombre_archivo_salida, 'w', encoding='utf-8') as archivo:
-            # Escribimos el encabezado
-            archivo.write("===== REPORTE DE TRANSACCIONES BANCARIAS =====\n")
-            
-            # Escribimos el resumen de montos
-            archivo.write("\nResumen de Montos:\n")
-            archivo.write(f"  - Total Créditos: ${estadisticas['suma_creditos']}\n")
-            archivo.write(f"  - Total Débitos: ${estadisticas['suma_debitos']}\n")
-            archivo.write(f"Balance Final: ${estadisticas['balance_final']}\n")
-            
-            # Escribimos la transacción de mayor monto
-            mayor = estadisticas['transaccion_mayor']
-            archivo.write(f"\nTransacción de Mayor Monto: ID {mayor['id']} con ${mayor['monto']}\n")
-            
-            # Escribimos el conteo de transacciones
-            creditos = estadisticas['contador_creditos']
-            debitos = estadisticas['contador_debitos']
-            archivo.write("\nConteo de Transacciones:\n")
-            archivo.write(f"  - Créditos: {creditos}\n")
-            archivo.write(f"  - Débitos: {debitos}\n")
-            archivo.write(f"  - Total: {creditos + debitos}\n")
+            # Escribimos todo el reporte de una sola vez
+            archivo.write(formatear_reporte(estadisticas))
             
         print(f"\nReporte guardado exitosamente en '{nombre_archivo_salida}'")
     except Exception as e:
         print(f"Error al guardar el reporte: {e}")
 
 
+def _leer_lineas(archivo, cantidad_bytes):
+    """
+    Entrega como texto las líneas de un archivo binario hasta leer la cantidad de bytes indicada.
+    
+    Args:
+        archivo (file): Archivo abierto en modo binario, ubicado al inicio de una línea
+        cantidad_bytes (int): Cantidad de bytes a leer desde la posición actual
+        
+    Yields:
+        str: Cada línea leída, decodificada como UTF-8
+    """
+    leidos = 0
+    while leidos < cantidad_bytes:
+        linea = archivo.readline()
+        if not linea:
+            break
+        leidos += len(linea)
+        yield linea.decode('utf-8')
+
+
+def _dividir_en_tramos(archivo, inicio, fin, cantidad):
+    """
+    Divide un rango de bytes del archivo en tramos que empiezan al inicio de una línea.
+    
+    Args:
+        archivo (file): Archivo abierto en modo binario
+        inicio (int): Posición donde empieza la primera fila de datos
+        fin (int): Tamaño del archivo en bytes
+        cantidad (int): Cantidad de tramos deseada
+        
+    Returns:
+        list: Lista de tuplas (inicio, fin) con los límites de cada tramo
+    """
+    limites = [inicio]
+    paso = max((fin - inicio) // cantidad, 1)
+    
+    for i in range(1, cantidad):
+        # Avanzamos hasta el final de la línea para no partir una fila en dos
+        archivo.seek(inicio + i * paso)
+        archivo.readline()
+        posicion = archivo.tell()
+        if limites[-1] < posicion < fin:
+            limites.append(posicion)
+    
+    limites.append(fin)
+    return list(zip(limites, limites[1:]))
+
+
+def _calcular_estadisticas_tramo(nombre_archivo, columnas, inicio, fin):
+    """
+    Calcula las estadísticas de las filas contenidas en un tramo del archivo.
+    
+    Args:
+        nombre_archivo (str): Ruta al archivo CSV
+        columnas (dict): Posición de cada columna dentro de las filas
+        inicio (int): Posición donde empieza el tramo
+        fin (int): Posición donde termina el tramo
+        
+    Returns:
+        dict: Diccionario con las estadísticas del tramo
+    """
+    with open(nombre_archivo, 'rb', buffering=TAMANO_BUFFER_LECTURA) as archivo:
+        archivo.seek(inicio)
+        lector_csv = csv.reader(_leer_lineas(archivo, fin - inicio))
+        return calcular_estadisticas(lector_csv, columnas)
+
+
+def _combinar_estadisticas(parciales):
+    """
+    Combina las estadísticas de varios tramos en un único resultado.
+    
+    Args:
+        parciales (iterable): Estadísticas de cada tramo, en el orden del archivo
+        
+    Returns:
+        dict: Diccionario con todas las estadísticas calculadas
+    """
+    suma_creditos = 0
+    suma_debitos = 0
+    transaccion_mayor = None
+    contador_creditos = 0
+    contador_debitos = 0
+    
+    for parcial in parciales:
+        suma_creditos += parcial['suma_creditos']
+        suma_debitos += parcial['suma_debitos']
+        contador_creditos += parcial['contador_creditos']
+        contador_debitos += parcial['contador_debitos']
+        
+        # Los tramos sin transacciones válidas no tienen transacción mayor.
+        # Ante un empate se conserva la transacción que aparece primero
+        mayor = parcial['transaccion_mayor']
+        if mayor['id'] is not None and (transaccion_mayor is None
+                                        or mayor['monto'] > transaccion_mayor['monto']):
+            transaccion_mayor = mayor
+    
+    return {
+        'suma_creditos': suma_creditos,
+        'suma_debitos': suma_debitos,
+        'balance_final': suma_creditos - suma_debitos,
+        'transaccion_mayor': transaccion_mayor or {'id': None, 'monto': 0},
+        'contador_creditos': contador_creditos,
+        'contador_debitos': contador_debitos
+    }
+
+
+def calcular_estadisticas_en_paralelo(nombre_archivo, procesos=None):
+    """
+    Calcula las estadísticas de un archivo CSV dividiéndolo en tramos que se
+    procesan en paralelo, cada uno en su propio proceso.
+    
+    Las filas no deben contener saltos de línea dentro de sus valores, ya que
+    los tramos se delimitan por líneas.
+    
+    Args:
+        nombre_archivo (str): Ruta al archivo CSV a procesar
+        procesos (int): Cantidad de procesos a usar; por defecto, uno por núcleo
+        
+    Returns:
+        dict: Diccionario con todas las estadísticas calculadas
+        None: Si el archivo no tiene las columnas necesarias
+    """
+    procesos = procesos or os.cpu_count() or 1
+    
+    with open(nombre_archivo, 'rb') as archivo:
+        # Leemos y validamos los encabezados antes de repartir el trabajo
+        encabezados = archivo.readline()
+        resultado = leer_archivo_csv([encabezados.decode('utf-8')])
+        if resultado is None:
+            return None
+        _, columnas = resultado
+        
+        inicio = archivo.tell()
+        fin = os.fstat(archivo.fileno()).st_size
+        tramos = _dividir_en_tramos(archivo, inicio, fin, procesos)
+    
+    with ProcessPoolExecutor(max_workers=len(tramos)) as ejecutor:
+        parciales = ejecutor.map(
+            _calcular_estadisticas_tramo,
+            [nombre_archivo] * len(tramos),
+            [columnas] * len(tramos),
+            [inicio for inicio, _ in tramos],
+            [fin for _, fin in tramos],
+        )
+        return _combinar_estadisticas(parciales)
+
+
+def calcular_estadisticas_archivo(nombre_archivo):
+    """
+    Lee un archivo CSV de transacciones y calcula sus estadísticas en una sola pasada.
+    
+    Args:
+        nombre_archivo (str): Ruta al archivo CSV a procesar
+        
+    Returns:
+        dict: Diccionario con todas las estadísticas calculadas
+        None: Si ocurre algún error al leer el archivo
+    """
+    try:
+        # Los archivos grandes se reparten entre varios procesos
+        if (os.path.getsize(nombre_archivo) >= TAMANO_MINIMO_PARALELO
+                and (os.cpu_count() or 1) > 1):
+            return calcular_estadisticas_en_paralelo(nombre_archivo)
+        
+        # Abrimos el archivo CSV para lectura. newline='' es lo que pide el
+        # módulo csv, y un búfer grande reduce las llamadas al sistema en
+        # archivos con muchas transacciones.
+        with open(nombre_archivo, 'r', encoding='utf-8', newline='',
+                  buffering=TAMANO_BUFFER_LECTURA) as archivo:
+            # Avisamos al sistema operativo que el archivo se leerá de principio
+            # a fin, para que adelante la lectura del disco (solo en POSIX).
+            # Es solo una sugerencia: si falla (por ejemplo, con una tubería)
+            # seguimos leyendo normalmente
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(archivo.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            
+            resultado = leer_archivo_csv(archivo)
+            
+            # Verificamos si pudimos leer el archivo correctamente
+            if resultado is None:
+                return None
+            lector_csv, columnas = resultado
+            
+            # Calculamos las estadísticas mientras recorremos el archivo
+            return calcular_estadisticas(lector_csv, columnas)
+            
+    except FileNotFoundError:
+        print(f"Error: No se pudo encontrar el archivo '{nombre_archivo}'")
+        return None
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        print(f"Error inesperado al leer el archivo: {e}")
+        return None
+
+
 def procesar_archivo_csv(nombre_archivo):
     """
     Procesa un archivo CSV de transacciones bancarias y genera un reporte.
@@ -206,23 +514,20 @@ def procesar_archivo_csv(nombre_archivo):
     Args:
         nombre_archivo (str): Ruta al archivo CSV a procesar
     """
-    # Leemos el archivo CSV
-    transacciones = leer_archivo_csv(nombre_archivo)
+    # Leemos el archivo CSV y calculamos todas las estadísticas
+    estadisticas = calcular_estadisticas_archivo(nombre_archivo)
     
     # Verificamos si pudimos leer el archivo correctamente
-    if transacciones is None:
+    if estadisticas is None:
         return
     
-    # Calculamos todas las estadísticas
-    estadisticas = calcular_estadisticas(transacciones)
-    
     # Generamos y mostramos el reporte
     generar_reporte(estadisticas)
     
     # Preguntamos al usuario si quiere guardar el reporte
     respuesta = input("\n¿Desea guardar el reporte en un archivo? (s/n): ")
     if respuesta.lower() == 's':
-        nombre_archivo_base = nombre_archivo.split('.')[0]
+        nombre_archivo_base, _ = os.path.splitext(nombre_archivo)
         nombre_archivo_salida = f"{nombre_archivo_base}_reporte.txt"
         guardar_reporte(estadisticas, nombre_archivo_salida)
 